@@ -0,0 +1,34 @@
+# hot helpers compiled by the native code emitters of MicroPython/CircuitPython
+# importing fails on CPython or on builds without the emitters(SyntaxError), pcf.py
+# falls back to the pure python versions then, keep both versions in sync
+import micropython
+
+
+@micropython.viper
+def unpack_metrics_entry_compressed(buffer, offset: int):
+    p = ptr8(buffer)
+    return (
+        int(p[offset]) - 0x80,
+        int(p[offset + 1]) - 0x80,
+        int(p[offset + 2]) - 0x80,
+        int(p[offset + 3]) - 0x80,
+        int(p[offset + 4]) - 0x80,
+        0,
+    )
+
+
+@micropython.native
+def get_glyph_index_offset(self, code_point: int) -> int:
+    # returns the entry offset of the code point in the encoding table
+    # -1 if out of range
+    if not (self._min_code_point <= code_point <= self._max_code_point):
+        return -1  # not available
+    enc2 = code_point & 0xFF
+    if not (self._min_byte2 <= enc2 <= self._max_byte2):
+        return -1  # not available
+    return (code_point >> 8) * self._enc_stride + enc2 - self._enc_base
+
+
+# stub micropython modules(e.g. on Blinka) accept the decorators but have no viper
+# types, fail here with NameError instead of on first use
+unpack_metrics_entry_compressed(b"\x80\x80\x80\x80\x80", 0)
@@ -1,30 +1,73 @@
-from collections import OrderedDict
-
 try:
-    from typing import Union, Optional, Any
+    from typing import Union, Optional, Any, Callable
 except ImportError:
     pass
 
+# node layout: [prev, next, key, value]
+_PREV = 0
+_NEXT = 1
+_KEY = 2
+_VALUE = 3
+
+
 class LruCache:
-    def __init__(self, capacity: int) -> None:
-        self._cache = OrderedDict()
+    def __init__(
+        self, capacity: int, on_evict: Optional[Callable[[Any, Any], None]] = None
+    ) -> None:
+        self._map = dict()
         self._capacity = capacity
+        # called with (key, value) for every evicted item
+        self._on_evict = on_evict
+        # sentinels, head side is the most recently used
+        self._head = [None, None, None, None]
+        self._tail = [None, None, None, None]
+        self._head[_NEXT] = self._tail
+        self._tail[_PREV] = self._head
+
+    def _link_front(self, node: list) -> None:
+        first = self._head[_NEXT]
+        node[_PREV] = self._head
+        node[_NEXT] = first
+        first[_PREV] = node
+        self._head[_NEXT] = node
+
+    @staticmethod
+    def _unlink(node: list) -> None:
+        prev_node = node[_PREV]
+        next_node = node[_NEXT]
+        prev_node[_NEXT] = next_node
+        next_node[_PREV] = prev_node
 
     def get(self, key: Union[int, str]) -> Optional[Any]:
-        data = self._cache.get(key, None)
-        if data is not None:
-            # move the key to head/front
-            # for popitem in CircuitPython only support LIFO order
-            self._cache.move_to_end(key, last=False)
-        return data
+        node = self._map.get(key, None)
+        if node is None:
+            return None
+        if self._head[_NEXT] is not node:
+            # move the node to head/front
+            self._unlink(node)
+            self._link_front(node)
+        return node[_VALUE]
 
     def put(self, key: Union[int, str], value: Any) -> None:
-        if len(self._cache) >= self._capacity:
-            # remove the last item
-            # TODO: discard in batch, like 10% once
-            self._cache.popitem()
-        self._cache[key] = value
-        self._cache.move_to_end(key, last=False)
-    
+        node = self._map.get(key, None)
+        if node is not None:
+            node[_VALUE] = value
+            self._unlink(node)
+            self._link_front(node)
+            return
+        if len(self._map) >= self._capacity:
+            # remove the least recently used items, 10% at once
+            for _ in range(max(1, self._capacity // 10)):
+                last = self._tail[_PREV]
+                if last is self._head:
+                    break
+                self._unlink(last)
+                del self._map[last[_KEY]]
+                if self._on_evict is not None:
+                    self._on_evict(last[_KEY], last[_VALUE])
+        node = [None, None, key, value]
+        self._link_front(node)
+        self._map[key] = node
+
     def contains(self, key: Union[int, str]) -> bool:
-        return key in self._cache
+        return key in self._map
@@ -1,7 +1,7 @@
 from .cache import LruCache
 
 try:
-    from typing import Union, Tuple, Iterable, Dict
+    from typing import Union, Tuple, Iterable, Iterator
     from io import FileIO
 except ImportError:
     pass
@@ -14,11 +14,19 @@ except ImportError:
         x
 
 
+try:
+    from . import _native
+except (ImportError, SyntaxError, AttributeError, NameError):
+    _native = None
+
+
+import array
 import gc
 import struct
+import sys
+from io import BytesIO
 from displayio import Bitmap as DisplayioBitmap
 from fontio import Glyph
-from collections import namedtuple
 
 # need this for easier handling of different padding schemes
 from bitmaptools import readinto as _bitmap_readinto
@@ -35,20 +43,35 @@ _PCF_SCAN_UNIT_MASK = const(3 << 4)
 _PCF_GLYPH_PAD_MASK = const(3 << 0)
 _PCF_COMPRESSED_METRICS = const(0x00000100)
 _PCF_ACCEL_W_INKBOUNDS = const(0x00000100)
-
-
-TableTocEntry = namedtuple("TableTocEntry", ("format", "size", "offset"))
-MetricsEntry = namedtuple(
-    "MetricsEntry",
-    (
-        "left_side_bearing",
-        "right_side_bearing",
-        "character_width",
-        "character_ascent",
-        "character_descent",
-        "character_attributes",
-    ),
-)
+_TOC_SLOT_ACCELERATORS = const(0)
+_TOC_SLOT_METRICS = const(1)
+_TOC_SLOT_BITMAPS = const(2)
+_TOC_SLOT_BDFENCODINGS = const(3)
+_TOC_SLOT_BDFACCELERATORS = const(4)
+_L1_SIZE = const(64)  # must be a power of 2
+_MAX_BATCH_READ = const(512)  # upper bound of a single coalesced table read
+_MAX_BITMAP_GAP = const(32)  # max unused bytes between bitmaps read together
+_INDEX_CACHE_SIZE = const(256)  # flushed as a whole when full
+
+# hot binary formats, sizes are precomputed to skip struct.calcsize
+# (struct.Struct is not available on CircuitPython)
+_FMT_U16 = ">H"
+_FMT_U32 = ">I"
+_FMT_METRICS_STANDARD = ">5hH"
+_FMT_METRICS_COMPRESSED = ">5B"
+_U16_SIZE = const(2)
+_U32_SIZE = const(4)
+_METRICS_STANDARD_SIZE = const(12)
+_METRICS_COMPRESSED_SIZE = const(5)
+
+
+# metrics entries are plain tuples, fields are accessed by these indices
+_METRICS_LEFT_SIDE_BEARING = const(0)
+_METRICS_RIGHT_SIDE_BEARING = const(1)
+_METRICS_CHARACTER_WIDTH = const(2)
+_METRICS_CHARACTER_ASCENT = const(3)
+_METRICS_CHARACTER_DESCENT = const(4)
+_METRICS_CHARACTER_ATTRIBUTES = const(5)
 
 
 def read_values(f: FileIO, format_: str) -> Tuple:
@@ -63,36 +86,28 @@ def bytes_per_row(width: int, bytes_align: int) -> int:
     return block_count * bytes_align
 
 
-def read_metrics_entry_standard(f: FileIO) -> MetricsEntry:
-    return MetricsEntry(*read_values(f, ">5hH"))
-
-
-def read_metrics_entry_compressed(f: FileIO) -> MetricsEntry:
-    (
-        left_side_bearing,
-        right_side_bearing,
-        character_width,
-        character_ascent,
-        character_descent,
-    ) = read_values(f, ">5B")
-    left_side_bearing -= 0x80
-    right_side_bearing -= 0x80
-    character_width -= 0x80
-    character_ascent -= 0x80
-    character_descent -= 0x80
-    attributes = 0
-    return MetricsEntry(
-        left_side_bearing,
-        right_side_bearing,
-        character_width,
-        character_ascent,
-        character_descent,
-        attributes,
-    )
+def read_metrics_entry_standard(f: FileIO) -> Tuple:
+    return struct.unpack(_FMT_METRICS_STANDARD, f.read(_METRICS_STANDARD_SIZE))
+
+
+def unpack_metrics_entry_standard(buffer: bytes, offset: int) -> Tuple:
+    return struct.unpack_from(_FMT_METRICS_STANDARD, buffer, offset)
+
+
+def unpack_metrics_entry_compressed(buffer: bytes, offset: int) -> Tuple:
+    # each field is stored as an unsigned byte biased by 0x80, attributes are 0
+    t = struct.unpack_from(_FMT_METRICS_COMPRESSED, buffer, offset)
+    return (t[0] - 0x80, t[1] - 0x80, t[2] - 0x80, t[3] - 0x80, t[4] - 0x80, 0)
+
+
+if _native is not None:
+    unpack_metrics_entry_compressed = _native.unpack_metrics_entry_compressed
 
 
 class PcfFont:
-    def __init__(self, filename: str, capacity: int = 128) -> None:
+    def __init__(
+        self, filename: str, capacity: int = 128, preload_limit: int = 4096
+    ) -> None:
         self._file = open(filename, "rb")
         self._file.seek(0)
         # verify file magic/header
@@ -100,8 +115,8 @@ class PcfFont:
             raise ValueError("Magic mismatch, unknown font file")
 
         (tables_count,) = read_values(self._file, "<I")
-        tables: Dict[TableTocEntry] = dict()
         # read all necessary tables(toc entries only)
+        # slot order must match the _TOC_SLOT_* constants
         necessary_tables_types = (
             _PCF_TABLETYPE_ACCELERATORS,
             _PCF_TABLETYPE_METRICS,
@@ -109,37 +124,52 @@ class PcfFont:
             _PCF_TABLETYPE_BDFENCODINGS,
             _PCF_TABLETYPE_BDFACCELERATORS,
         )
+        # toc entries as parallel arrays, one slot per necessary table type
+        # offset 0 marks a missing table, as the file header lives there
+        tables_formats = array.array("I", [0] * len(necessary_tables_types))
+        tables_offsets = array.array("I", [0] * len(necessary_tables_types))
         for _ in range(tables_count):
             type_, format_, size, offset = read_values(self._file, "<IIII")
             if type_ in necessary_tables_types:
-                tables[type_] = TableTocEntry(format_, size, offset)
-        if len(tables) < 4:  # either bdf_accel or accel can be missed
+                slot = necessary_tables_types.index(type_)
+                tables_formats[slot] = format_
+                tables_offsets[slot] = offset
+        # either bdf_accel or accel can be missed
+        if (
+            not tables_offsets[_TOC_SLOT_METRICS]
+            or not tables_offsets[_TOC_SLOT_BITMAPS]
+            or not tables_offsets[_TOC_SLOT_BDFENCODINGS]
+            or not (
+                tables_offsets[_TOC_SLOT_ACCELERATORS]
+                or tables_offsets[_TOC_SLOT_BDFACCELERATORS]
+            )
+        ):
             raise ValueError("Corrupted font data")
         # check data formats
-        for entry in tables.values():
-            if entry.format & (_PCF_BYTE_MASK | _PCF_BIT_MASK) != (
+        for format_, offset in zip(tables_formats, tables_offsets):
+            if offset and format_ & (_PCF_BYTE_MASK | _PCF_BIT_MASK) != (
                 _PCF_BYTE_MASK | _PCF_BIT_MASK
             ):
                 raise ValueError("Only support MSByte data and MSBit glyph")
         # check bitmaps format
-        if tables[_PCF_TABLETYPE_BITMAPS].format & _PCF_SCAN_UNIT_MASK != 0:
+        if tables_formats[_TOC_SLOT_BITMAPS] & _PCF_SCAN_UNIT_MASK != 0:
             raise ValueError("Only support bits stored in bytes")
         self._glyph_padding = 2 ** (
-            tables[_PCF_TABLETYPE_BITMAPS].format & _PCF_GLYPH_PAD_MASK
+            tables_formats[_TOC_SLOT_BITMAPS] & _PCF_GLYPH_PAD_MASK
         )
 
         # process all necessary tables, check formats at the same time
 
         # Bitmaps table
         self._file.seek(
-            tables[_PCF_TABLETYPE_BITMAPS].offset + 4
+            tables_offsets[_TOC_SLOT_BITMAPS] + 4
         )  # skip 4 bytes format field
         (glyph_count,) = read_values(self._file, ">I")
 
         # Metrics table
-        self._file.seek(tables[_PCF_TABLETYPE_METRICS].offset + 4)
+        self._file.seek(tables_offsets[_TOC_SLOT_METRICS] + 4)
         metrics_compressed = (
-            tables[_PCF_TABLETYPE_METRICS].format & _PCF_COMPRESSED_METRICS > 0
+            tables_formats[_TOC_SLOT_METRICS] & _PCF_COMPRESSED_METRICS > 0
         )
         (metrics_count,) = (
             read_values(self._file, ">H")
@@ -152,7 +182,7 @@ class PcfFont:
 
         # Encoding table
         # TODO: use default_char as fallback?
-        self._file.seek(tables[_PCF_TABLETYPE_BDFENCODINGS].offset + 4)
+        self._file.seek(tables_offsets[_TOC_SLOT_BDFENCODINGS] + 4)
         (
             self._min_byte2,
             self._max_byte2,
@@ -160,46 +190,85 @@ class PcfFont:
             self._max_byte1,
             self._default_char,
         ) = read_values(self._file, ">hhhhh")
+        # precomputed for _get_glyph_index_offset
+        self._enc_stride = self._max_byte2 - self._min_byte2 + 1
+        self._enc_base = self._min_byte1 * self._enc_stride + self._min_byte2
+        self._min_code_point = (self._min_byte1 << 8) | self._min_byte2
+        self._max_code_point = (self._max_byte1 << 8) | self._max_byte2
 
         # Accelerators table
-        acc_table = (
-            tables.get(_PCF_TABLETYPE_ACCELERATORS)
-            if _PCF_TABLETYPE_ACCELERATORS in tables
-            else tables.get(_PCF_TABLETYPE_BDFACCELERATORS)
+        acc_slot = (
+            _TOC_SLOT_ACCELERATORS
+            if tables_offsets[_TOC_SLOT_ACCELERATORS]
+            else _TOC_SLOT_BDFACCELERATORS
         )
-        self._file.seek(acc_table.offset + 4 + 8)
+        acc_offset = tables_offsets[acc_slot]
+        self._file.seek(acc_offset + 4 + 8)
         self._ascent, self._descent = read_values(self._file, ">ii")
-        if acc_table.format & _PCF_ACCEL_W_INKBOUNDS > 0:
+        if tables_formats[acc_slot] & _PCF_ACCEL_W_INKBOUNDS > 0:
             # has ink_minbounds and ink_maxbounds, use them instead of minbounds and maxbounds
-            self._file.seek(acc_table.offset + 4 + 8 + 4 + 4 + 4 + 24)
+            self._file.seek(acc_offset + 4 + 8 + 4 + 4 + 4 + 24)
         else:
-            self._file.seek(acc_table.offset + 4 + 8 + 4 + 4 + 4)
+            self._file.seek(acc_offset + 4 + 8 + 4 + 4 + 4)
         minbounds = read_metrics_entry_standard(self._file)
         maxbounds = read_metrics_entry_standard(self._file)
-        width = maxbounds.right_side_bearing - minbounds.left_side_bearing
-        height = maxbounds.character_ascent + maxbounds.character_descent
+        width = (
+            maxbounds[_METRICS_RIGHT_SIDE_BEARING]
+            - minbounds[_METRICS_LEFT_SIDE_BEARING]
+        )
+        height = (
+            maxbounds[_METRICS_CHARACTER_ASCENT]
+            + maxbounds[_METRICS_CHARACTER_DESCENT]
+        )
 
         self._bounding_box = (
             width,
             height,
-            minbounds.left_side_bearing,
-            -maxbounds.character_descent,
+            minbounds[_METRICS_LEFT_SIDE_BEARING],
+            -maxbounds[_METRICS_CHARACTER_DESCENT],
         )
         self._bitmap_position_lut_location = (
-            tables[_PCF_TABLETYPE_BITMAPS].offset + 4 + 4
+            tables_offsets[_TOC_SLOT_BITMAPS] + 4 + 4
         )
         self._bitmap_data_location = (
             self._bitmap_position_lut_location + (glyph_count + 4) * 4
         )
         self._metrics_data_location = (
-            tables[_PCF_TABLETYPE_METRICS].offset + 4 + (2 if metrics_compressed else 4)
+            tables_offsets[_TOC_SLOT_METRICS] + 4 + (2 if metrics_compressed else 4)
         )
         self._encoded_glyph_indices_location = (
-            tables[_PCF_TABLETYPE_BDFENCODINGS].offset + 4 + 5 * 2
+            tables_offsets[_TOC_SLOT_BDFENCODINGS] + 4 + 5 * 2
         )
 
+        # keep the whole encoding table in RAM if it's small enough(dense fonts)
+        self._enc_table = None
+        enc_count = (self._max_byte1 - self._min_byte1 + 1) * self._enc_stride
+        if enc_count * _U16_SIZE <= preload_limit:
+            self._file.seek(self._encoded_glyph_indices_location)
+            data = self._file.read(enc_count * _U16_SIZE)
+            if len(data) != enc_count * _U16_SIZE:
+                raise ValueError("Corrupted font data")
+            enc_table = array.array("H", data)
+            if sys.byteorder == "little":
+                # stored as big endian
+                for i in range(enc_count):
+                    value = enc_table[i]
+                    enc_table[i] = ((value & 0xFF) << 8) | (value >> 8)
+            self._enc_table = enc_table
+
         # finally, prepare the cache
-        self._cache = LruCache(capacity)
+        # evicted glyphs are dropped from the L1 cache too, so it never holds
+        # glyphs outside the LRU cache
+        self._cache = LruCache(capacity, self._forget_l1)
+        # direct-mapped cache in front of the LRU cache, indexed by low bits of code point
+        self._l1_keys = array.array("i", [-1] * _L1_SIZE)
+        self._l1_vals = [None] * _L1_SIZE
+        # scratch buffer for table reads, avoids allocating on every read
+        self._read_buffer = bytearray(_MAX_BATCH_READ)
+        self._read_buffer_view = memoryview(self._read_buffer)
+        # code point -> glyph index(-1 if not available), saves encoding table reads
+        # only used if the encoding table is not preloaded
+        self._index_cache = dict()
 
     def load_glyphs(self, code_points: Union[int, str, Iterable[int]]) -> None:
         """Loads displayio.Glyph objects into the cache."""
@@ -209,33 +278,85 @@ class PcfFont:
             code_points = [ord(c) for c in code_points]
 
         # only load absent code points, in order
-        code_points = sorted(c for c in code_points if not self._cache.contains(c))
+        # present ones are refreshed, glyphs served by the L1 cache in get_glyph
+        # never touch the LRU cache otherwise
+        cache = self._cache
+        code_points = [c for c in code_points if cache.get(c) is None]
+        code_points.sort()
         if not code_points:
             return
 
+        # known glyph indices come from the index cache, the rest from the file
+        # a preloaded encoding table needs no cache, lookups are already cheap
+        # code points are sorted, so are their offsets in the encoding table
+        use_index_cache = self._enc_table is None
+        found = dict()
+        index_offsets = dict()
+        for c in code_points:
+            if use_index_cache:
+                glyph_index = self._index_cache.get(c, None)
+                if glyph_index is not None:
+                    found[c] = glyph_index
+                    continue
+            index_offset = self._get_glyph_index_offset(c)
+            if index_offset >= 0:
+                index_offsets[index_offset] = c
+        for index_offset, glyph_index in self._iter_encoding_entries(index_offsets):
+            if glyph_index == 0xFFFF:
+                glyph_index = -1  # not available
+            c = index_offsets[index_offset]
+            found[c] = glyph_index
+            if use_index_cache:
+                if len(self._index_cache) >= _INDEX_CACHE_SIZE:
+                    self._index_cache.clear()
+                self._index_cache[c] = glyph_index
         # implied de-duplication here :)
         # char order is preserved somehow
-        glyphs_indices = {
-            c: index for c in code_points if (index := self._get_glyph_index(c)) >= 0
-        }
+        glyphs_indices = {c: found[c] for c in code_points if found.get(c, -1) >= 0}
         if not glyphs_indices:
             return
 
-        bitmaps_offsets = [
-            self._get_glyph_bitmap_offset(i) for i in glyphs_indices.values()
-        ]
-        char_metrics = [self._get_metrics(i) for i in glyphs_indices.values()]
+        lut_offsets = dict()
+        for glyph_index, blob, pos in self._iter_table_entries(
+            self._bitmap_position_lut_location,
+            _U32_SIZE,
+            set(glyphs_indices.values()),
+        ):
+            (lut_offsets[glyph_index],) = struct.unpack_from(_FMT_U32, blob, pos)
+        if self._metrics_compressed:
+            metrics_size = _METRICS_COMPRESSED_SIZE
+            unpack_metrics = unpack_metrics_entry_compressed
+        else:
+            metrics_size = _METRICS_STANDARD_SIZE
+            unpack_metrics = unpack_metrics_entry_standard
+        metrics_by_index = dict()
+        for glyph_index, blob, pos in self._iter_table_entries(
+            self._metrics_data_location, metrics_size, lut_offsets
+        ):
+            metrics_by_index[glyph_index] = unpack_metrics(blob, pos)
 
         gc.collect()
 
-        # batch creating bitmaps
-        bitmaps = [None] * len(glyphs_indices)
-        for i, (metrics, code_point) in enumerate(
-            zip(char_metrics, glyphs_indices.keys())
-        ):
-            width = metrics.right_side_bearing - metrics.left_side_bearing
-            height = metrics.character_ascent + metrics.character_descent
-            bitmap = bitmaps[i] = DisplayioBitmap(width, height, 2)
+        # batch creating bitmaps, collect (bitmap offset, size, bitmap) to read later
+        bitmaps = []
+        for code_point, glyph_index in glyphs_indices.items():
+            metrics = metrics_by_index[glyph_index]
+            width = (
+                metrics[_METRICS_RIGHT_SIDE_BEARING]
+                - metrics[_METRICS_LEFT_SIDE_BEARING]
+            )
+            height = (
+                metrics[_METRICS_CHARACTER_ASCENT]
+                + metrics[_METRICS_CHARACTER_DESCENT]
+            )
+            bitmap = DisplayioBitmap(width, height, 2)
+            bitmaps.append(
+                (
+                    lut_offsets[glyph_index],
+                    bytes_per_row(width, self._glyph_padding) * height,
+                    bitmap,
+                )
+            )
             self._cache.put(
                 code_point,
                 Glyph(
@@ -243,62 +364,124 @@ class PcfFont:
                     0,
                     width,
                     height,
-                    metrics.left_side_bearing,
-                    -metrics.character_descent,
-                    metrics.character_width,
+                    metrics[_METRICS_LEFT_SIDE_BEARING],
+                    -metrics[_METRICS_CHARACTER_DESCENT],
+                    metrics[_METRICS_CHARACTER_WIDTH],
                     0,
                 ),
             )
 
-        for bmp_offset, bitmap in zip(bitmaps_offsets, bitmaps):
-            self._file.seek(self._bitmap_data_location + bmp_offset)
-            _bitmap_readinto(
-                bitmap,
-                self._file,
-                bits_per_pixel=1,
-                element_size=self._glyph_padding,
-                reverse_pixels_in_element=True,  # TODO: add glyph LSBit first support
-            )
+        # read in file order, keeps the access sequential
+        # runs of nearby bitmaps are fetched with one read
+        bitmaps.sort(key=lambda t: t[0])
+        count = len(bitmaps)
+        start = 0
+        while start < count:
+            low, size, bitmap = bitmaps[start]
+            high = low + size
+            end = start + 1
+            while end < count:
+                offset, size, _ = bitmaps[end]
+                if offset - high > _MAX_BITMAP_GAP or (
+                    offset + size - low > _MAX_BATCH_READ
+                ):
+                    break
+                high = max(high, offset + size)
+                end += 1
+            self._file.seek(self._bitmap_data_location + low)
+            if end - start == 1:
+                self._readinto_bitmap(bitmap, self._file)
+            else:
+                stream = BytesIO(self._file.read(high - low))
+                for i in range(start, end):
+                    offset, _, bitmap = bitmaps[i]
+                    stream.seek(offset - low)
+                    self._readinto_bitmap(bitmap, stream)
+            start = end
+
+    def _readinto_bitmap(self, bitmap: DisplayioBitmap, stream) -> None:
+        _bitmap_readinto(
+            bitmap,
+            stream,
+            bits_per_pixel=1,
+            element_size=self._glyph_padding,
+            reverse_pixels_in_element=True,  # TODO: add glyph LSBit first support
+        )
 
-    def _get_glyph_index(self, code_point: int) -> int:
-        # returns the index of the glyph
-        # -1 if not available
-        enc1 = (code_point >> 8) & 0xFF
-        enc2 = code_point & 0xFF
-        if not (self._min_byte1 <= enc1 <= self._max_byte1) or not (
-            self._min_byte2 <= enc2 <= self._max_byte2
-        ):
+    def _get_glyph_index_offset(self, code_point: int) -> int:
+        # returns the entry offset of the code point in the encoding table
+        # -1 if out of range
+        if not (self._min_code_point <= code_point <= self._max_code_point):
             return -1  # not available
-        index_offset = (enc1 - self._min_byte1) * (
-            self._max_byte2 - self._min_byte2 + 1
-        ) + (enc2 - self._min_byte2)
-        self._file.seek(self._encoded_glyph_indices_location + index_offset * 2)
-        (glyph_index,) = read_values(self._file, ">H")
-        if glyph_index == 0xFFFF:
+        enc2 = code_point & 0xFF
+        if not (self._min_byte2 <= enc2 <= self._max_byte2):
             return -1  # not available
-        else:
-            return glyph_index
-
-    def _get_glyph_bitmap_offset(self, glyph_index: int) -> int:
-        self._file.seek(self._bitmap_position_lut_location + glyph_index * 4)
-        (offset,) = read_values(self._file, ">I")
-        return offset
-
-    def _get_metrics(self, glyph_index) -> MetricsEntry:
-        if self._metrics_compressed:
-            self._file.seek(self._metrics_data_location + glyph_index * 5)
-            return read_metrics_entry_compressed(self._file)
-        else:
-            self._file.seek(self._metrics_data_location + glyph_index * 12)
-            return read_metrics_entry_standard(self._file)
+        return (code_point >> 8) * self._enc_stride + enc2 - self._enc_base
+
+    if _native is not None:
+        _get_glyph_index_offset = _native.get_glyph_index_offset
+
+    def _iter_encoding_entries(
+        self, index_offsets: Iterable[int]
+    ) -> Iterator[Tuple[int, int]]:
+        # yields (index offset, raw glyph index) for each offset, in offset order
+        if self._enc_table is not None:
+            enc_table = self._enc_table
+            for index_offset in sorted(index_offsets):
+                yield index_offset, enc_table[index_offset]
+            return
+        for index_offset, blob, pos in self._iter_table_entries(
+            self._encoded_glyph_indices_location, _U16_SIZE, index_offsets
+        ):
+            (glyph_index,) = struct.unpack_from(_FMT_U16, blob, pos)
+            yield index_offset, glyph_index
+
+    def _iter_table_entries(
+        self, location: int, entry_size: int, indices: Iterable[int]
+    ) -> Iterator[Tuple[int, bytes, int]]:
+        # yields (index, buffer, position in buffer) for each entry, in index order
+        # nearby entries are fetched with one read, bounded by _MAX_BATCH_READ
+        # the buffer is shared and overwritten by the next read, consume it at once
+        indices = sorted(indices)
+        count = len(indices)
+        start = 0
+        while start < count:
+            low = indices[start]
+            end = start + 1
+            while (
+                end < count
+                and (indices[end] - low + 1) * entry_size <= _MAX_BATCH_READ
+            ):
+                end += 1
+            self._file.seek(location + low * entry_size)
+            size = (indices[end - 1] - low + 1) * entry_size
+            if self._file.readinto(self._read_buffer_view[:size]) != size:
+                # short read, the buffer still holds the previous window
+                raise ValueError("Corrupted font data")
+            for i in range(start, end):
+                yield indices[i], self._read_buffer, (indices[i] - low) * entry_size
+            start = end
+
+    def _forget_l1(self, code_point: int, glyph: Glyph) -> None:
+        slot = code_point & (_L1_SIZE - 1)
+        if self._l1_keys[slot] == code_point:
+            self._l1_keys[slot] = -1
+            self._l1_vals[slot] = None
 
     def get_glyph(self, code_point: int) -> Glyph:
         """Returns a displayio.Glyph for the given code point or None is unsupported."""
-        if not self._cache.contains(code_point):
+        slot = code_point & (_L1_SIZE - 1)
+        if self._l1_keys[slot] == code_point:
+            return self._l1_vals[slot]
+        glyph = self._cache.get(code_point)
+        if glyph is None:
             # load glyph if not found
             self.load_glyphs(code_point)
-            gc.collect()
-        return self._cache.get(code_point)
+            glyph = self._cache.get(code_point)
+        if glyph is not None:
+            self._l1_keys[slot] = code_point
+            self._l1_vals[slot] = glyph
+        return glyph
 
     @property
     def ascent(self) -> int: